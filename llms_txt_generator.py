@@ -12,23 +12,30 @@ License: MIT
 
 import os
 import json
+import asyncio
 import yaml
 import datetime
 import shutil
 import signal
 import sys
+import threading
 import time
 import re
 import hashlib
+import html
 import logging
 import argparse
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Union, Tuple
+from dataclasses import dataclass, fields
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from contextlib import ExitStack, contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from operator import attrgetter
 from urllib.parse import urljoin, urlparse, quote
 import xml.etree.ElementTree as ET
 
@@ -36,6 +43,7 @@ import xml.etree.ElementTree as ET
 try:
     import requests
     from requests.adapters import HTTPAdapter
+    from requests.packages.urllib3.util import make_headers
     from requests.packages.urllib3.util.retry import Retry
 except ImportError:
     print("❌ Missing required package: requests")
@@ -56,6 +64,38 @@ except ImportError:
     print("Install with: pip install python-frontmatter")
     sys.exit(1)
 
+# Optional accelerators - fall back to the standard library when missing
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+try:
+    # The Lexbor backend: selectolax 1.0 dropped the Modest-based selectolax.parser
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Setup enhanced logging
 def setup_logging(level='INFO', log_file=None, format_str=None):
     """Setup enhanced logging configuration"""
@@ -85,9 +125,82 @@ __author__ = "AsifMinar"
 __email__ = "asifminar7@gmail.com"
 __license__ = "MIT"
 
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+# Precompiled patterns used in the per-item content pipeline
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\b\w+\b')
+_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_MD_IMG_RE = re.compile(r'!\[.*?\]\(.*?\)')
+_MD_LINK_RE = re.compile(r'\[.*?\]\(.*?\)')
+_SENTENCE_RE = re.compile(r'[.!?]+')
+
+# Sitemap URL classification: substrings matched case-insensitively anywhere in the URL
+_SITEMAP_SKIP_RE = re.compile(
+    r'/admin|/api|/wp-admin|/wp-content|/wp-includes'
+    r'|\.xml|\.js|\.css|\.png|\.jpg|\.jpeg|\.gif|\.svg'
+    r'|/feed|/rss|/sitemap|/robots\.txt',
+    re.IGNORECASE
+)
+_BLOG_URL_RE = re.compile(r'/blog/|/post/|/article/|/news/|/press/', re.IGNORECASE)
+_DRAFT_RE = re.compile(r'draft', re.IGNORECASE)
+_LLMS_TXT_RE = re.compile(rb'llms\.txt', re.IGNORECASE)
+# One scan tallies every marker validate_llms_txt counts; '# =' and '# LLMs.txt' are told apart by group
+_VALIDATE_MARKER_RE = re.compile(r'# (=|LLMs\.txt)?|URL: |Type: ')
+
+_ENGLISH_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an'})
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Encode JSON to UTF-8 bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, default=str).encode('utf-8')
+
+
+def _cache_format(cache_file: Union[str, Path]) -> str:
+    """Format a cache file is written in: compact msgpack when available, but always
+    JSON for a *.json name so tools that read it as JSON keep working"""
+    if msgpack is None or Path(cache_file).suffix.lower() == '.json':
+        return 'json'
+    return 'msgpack'
+
+
+def _cache_dumps(obj: Dict, cache_format: str) -> bytes:
+    """Encode the cache file in `cache_format`, as returned by _cache_format()"""
+    if cache_format == 'msgpack':
+        return msgpack.packb(obj, default=str, use_bin_type=True)
+    return _json_dumps(obj)
+
+
+def _cache_loads(data: bytes) -> Dict:
+    """Decode a cache file written as either msgpack or JSON (older caches are always JSON)"""
+    if data.lstrip()[:1] == b'{':
+        return _json_loads(data)
+    if msgpack is None:
+        raise ValueError("cache file is msgpack-encoded but msgpack is not installed")
+    return msgpack.unpackb(data, raw=False)
 
-@dataclass
-class ContentItem:
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _ContentItemCaches:
+    """Slots for ContentItem's per-item caches, declared outside the dataclass so that
+    fields(), asdict(), repr() and == only ever see the public fields"""
+    __slots__ = ('_fingerprint', '_rendered', '_title_key')
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ContentItem(_ContentItemCaches):
     """Represents a single content item for llms.txt"""
     title: str
     url: str
@@ -100,63 +213,218 @@ class ContentItem:
     language: Optional[str] = None
     reading_time: Optional[int] = None
     
+    def __post_init__(self):
+        self._fingerprint = None  # digest of the rendered fields, see fingerprint
+        self._rendered = None  # to_llms_format() output, memoised by the generator
+        # Case-insensitive sort key, computed once instead of on every sort
+        self._title_key = (self.title or '').casefold()
+    
+    @property
+    def fingerprint(self) -> bytes:
+        """Digest of every rendered field, computed once and cached on the item"""
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.blake2b(_json_dumps(self.to_dict(), sort_keys=True), digest_size=16).digest()
+        return self._fingerprint
+    
     def to_llms_format(self) -> str:
         """Convert to llms.txt format"""
-        lines = [f"# {self.title}"]
-        lines.append(f"URL: {self.url}")
-        lines.append(f"Type: {self.content_type}")
-        
+        description = ""
         if self.description:
             # Clean and truncate description
-            clean_desc = re.sub(r'<[^>]+>', '', self.description).strip()
+            clean_desc = _HTML_TAG_RE.sub('', self.description).strip()
             if len(clean_desc) > 300:
                 clean_desc = clean_desc[:300] + '...'
-            lines.append(f"Description: {clean_desc}")
-            
-        if self.last_modified:
-            lines.append(f"Last Modified: {self.last_modified}")
-        if self.author:
-            lines.append(f"Author: {self.author}")
-        if self.language:
-            lines.append(f"Language: {self.language}")
-        if self.tags:
-            lines.append(f"Tags: {', '.join(self.tags[:10])}")  # Limit to 10 tags
-        if self.word_count:
-            lines.append(f"Word Count: {self.word_count}")
-        if self.reading_time:
-            lines.append(f"Reading Time: {self.reading_time} minutes")
-            
-        lines.append("")  # Empty line separator
-        return "\n".join(lines)
+            description = f"Description: {clean_desc}\n"
+        
+        last_modified = f"Last Modified: {self.last_modified}\n" if self.last_modified else ""
+        author = f"Author: {self.author}\n" if self.author else ""
+        language = f"Language: {self.language}\n" if self.language else ""
+        tags = f"Tags: {', '.join(self.tags[:10])}\n" if self.tags else ""  # Limit to 10 tags
+        word_count = f"Word Count: {self.word_count}\n" if self.word_count else ""
+        reading_time = f"Reading Time: {self.reading_time} minutes\n" if self.reading_time else ""
+        
+        return (
+            f"# {self.title}\nURL: {self.url}\nType: {self.content_type}\n"
+            f"{description}{last_modified}{author}{language}{tags}{word_count}{reading_time}"
+        )
     
     def calculate_reading_time(self) -> int:
         """Calculate reading time based on word count (250 words per minute)"""
         if self.word_count:
             return max(1, round(self.word_count / 250))
         return 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field mapping; unlike dataclasses.asdict it does not deep-copy tags"""
+        return dict(zip(_CONTENT_ITEM_FIELDS, _content_item_values(self)))
 
 
-class ContentExtractor(ABC):
-    """Abstract base class for content extractors"""
+_CONTENT_ITEM_FIELDS = tuple(f.name for f in fields(ContentItem))
+# Fetches every public field in one C-level call, in _CONTENT_ITEM_FIELDS order
+_content_item_values = attrgetter(*_CONTENT_ITEM_FIELDS)
+
+# Sort keys for the output.sort_by option
+_SORT_KEYS = {
+    'title': attrgetter('_title_key'),
+    'word_count': lambda item: item.word_count or 0,
+    'last_modified': lambda item: item.last_modified or "",
+}
+
+
+def _find_first(names: Tuple[str, ...], dirs: Tuple[str, ...] = ('.', 'public', 'static')) -> Optional[Path]:
+    """Return the first of `names` present in `dirs`, scanning each directory once.
     
-    def __init__(self):
-        self.session = self._create_session()
+    Directories are tried in order, and within a directory `names` are tried in order.
+    """
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as it:
+                present = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            continue
+        for name in names:
+            if name in present:
+                return Path(directory, name)
+    return None
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write `data` to a temp file beside `path` and rename it over the original.
     
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry strategy"""
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+    The original inode is never modified in place, so hard-linked backups keep the old content.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def map_io(func: Callable[[Any], Any], iterable: Iterable[Any], workers: Optional[int] = None,
+           window: Optional[int] = None) -> Iterator[Any]:
+    """Map an I/O-bound `func` over `iterable` on a thread pool, yielding results in input order.
+    
+    At most `window` calls are queued ahead of the consumer, so long inputs are never
+    submitted all at once, and closing the iterator early cancels whatever has not started.
+    """
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+    window = max(window or workers * 2, workers)
+    iterator = iter(iterable)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for arg in islice(iterator, window):
+                pending.append(executor.submit(func, arg))
+            while pending:
+                result = pending.popleft().result()
+                for arg in islice(iterator, 1):
+                    pending.append(executor.submit(func, arg))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def create_session(pool_size: int = 50, cache_duration: int = 0,
+                   cache_name: str = '.llms_http_cache') -> requests.Session:
+    """Create a requests session with retry strategy and a keep-alive connection pool"""
+    if cache_duration and cache_duration > 0 and requests_cache is not None:
+        # Responses expire immediately: only those carrying ETag/Last-Modified are kept, and
+        # only ever reused after a conditional GET returns 304, so nothing stale is served
+        session = requests_cache.CachedSession(
+            cache_name=cache_name,
+            backend='sqlite',
+            expire_after=0,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        session.headers.update({
-            'User-Agent': f'LLMs.txt Generator {__version__} (https://github.com/AsifMinar/Universal-LLMS.txt-Generator)'
-        })
-        return session
+    else:
+        session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    # Size the pool above the worker counts used for concurrent fetches so
+    # threads never wait on, or discard, pooled connections to the same host
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry_strategy,
+        pool_block=False,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        'User-Agent': f'LLMs.txt Generator {__version__} (https://github.com/AsifMinar/Universal-LLMS.txt-Generator)',
+        'Connection': 'keep-alive',
+    })
+    # Advertise every encoding urllib3 can decode here (adds 'br' when brotli is installed);
+    # streamed sitemap bodies are decompressed on the fly via decode_content
+    session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+    return session
+
+
+class _LazySession:
+    """Stands in for a session made by `factory`, which is only called on first use.
+    
+    Runs that never touch HTTP (static sites, --validate) therefore never open the
+    HTTP cache. cache_disabled() bypasses the cache, if there is one, for the whole session.
+    """
+    
+    def __init__(self, factory: Callable[[], requests.Session]):
+        self._factory = factory
+        self._session = None
+        self._lock = threading.Lock()
+        self._bypass = 0
+        self._bypass_stack = ExitStack()
+    
+    def _resolve(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = self._factory()
+                    if self._bypass:
+                        self._disable_cache(session)
+                    self._session = session
+        return self._session
+    
+    def _disable_cache(self, session: requests.Session):
+        disabled = getattr(session, 'cache_disabled', None)
+        if disabled is not None:
+            self._bypass_stack.enter_context(disabled())
+    
+    @contextmanager
+    def cache_disabled(self):
+        with self._lock:
+            self._bypass += 1
+            if self._bypass == 1 and self._session is not None:
+                self._disable_cache(self._session)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._bypass -= 1
+                if not self._bypass:
+                    self._bypass_stack.close()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+
+class ContentExtractor(ABC):
+    """Abstract base class for content extractors"""
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session if session is not None else create_session()
+        # Thread-pool mapper for I/O-bound work; LLMsTxtGenerator swaps in one tuned from its config
+        self.io_map = map_io
     
     @abstractmethod
     def extract_content(self, config: Dict) -> List[ContentItem]:
@@ -172,39 +440,74 @@ class ContentExtractor(ABC):
         """Validate configuration for this extractor"""
         return True
     
+    def content_signature(self, config: Dict) -> Optional[str]:
+        """Cheap probe that changes whenever the source content does, or None if unsupported.
+        
+        When the signature matches the one cached by the previous run, extraction is skipped.
+        """
+        return None
+    
+    def discard_signature_state(self):
+        """Drop anything content_signature() kept for the extract_content() call that usually follows.
+        
+        Called when a run stops after the signature check, so a later extraction starts fresh.
+        """
+    
     def _clean_html(self, html_content: str) -> str:
         """Clean HTML content and extract text"""
+        return self._extract_text(html_content)[0]
+    
+    def _extract_text(self, html_content: str) -> Tuple[str, int]:
+        """Extract whitespace-normalised text and its word count in one tokenization pass"""
         if not html_content:
-            return ""
+            return "", 0
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text and clean whitespace
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            return ' '.join(chunk for chunk in chunks if chunk)
+            if HTMLParser is not None:
+                tree = HTMLParser(html_content)
+                for node in tree.css('script, style'):
+                    node.decompose()
+                root = tree.body if tree.body is not None else tree.root
+                # No separator, like get_text(): inline tags must not split words or punctuation
+                text = root.text(separator='') if root is not None else ''
+            else:
+                soup = BeautifulSoup(html_content, 'html.parser')
+                # Remove script and style elements
+                for script in soup(["script", "style"]):
+                    script.decompose()
+                text = soup.get_text()
         except Exception as e:
             logger.warning(f"Error cleaning HTML: {e}")
-            return re.sub(r'<[^>]+>', '', html_content)
+            text = _HTML_TAG_RE.sub('', html_content)
+        
+        words = text.split()
+        return ' '.join(words), len(words)
+    
+    def _strip_tags(self, html_fragment: str) -> str:
+        """Cheaply convert a short HTML fragment (title, excerpt) to text"""
+        if not html_fragment:
+            return ""
+        
+        # Only script/style bodies need a real parser to be dropped
+        lowered = html_fragment.lower()
+        if '<script' in lowered or '<style' in lowered:
+            return self._clean_html(html_fragment)
+        
+        # Tags go without a trace, as with get_text(); the split/join normalises whitespace
+        return ' '.join(html.unescape(_HTML_TAG_RE.sub('', html_fragment)).split())
     
     def _detect_language(self, text: str) -> Optional[str]:
         """Simple language detection"""
         if not text:
             return None
         
-        # Simple heuristic - count common English words
-        english_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an'}
-        words = re.findall(r'\b\w+\b', text.lower())
-        if not words:
+        # Simple heuristic - count common English words in the first 100 words
+        sample = [match.group().lower() for match in islice(_WORD_RE.finditer(text), 100)]
+        if not sample:
             return None
         
-        english_count = sum(1 for word in words[:100] if word in english_words)
-        if english_count / min(len(words), 100) > 0.1:
+        english_count = sum(map(_ENGLISH_WORDS.__contains__, sample))
+        if english_count / len(sample) > 0.1:
             return 'en'
         
         return None
@@ -242,68 +545,76 @@ class WordPressExtractor(ContentExtractor):
             try:
                 categories_response = self.session.get(f"{api_url}/categories", timeout=30)
                 if categories_response.status_code == 200:
-                    categories = categories_response.json()
+                    categories = _json_loads(categories_response.content)
+                    exclude_slugs = set(exclude_categories)
+                    exclude_names = {ec.lower() for ec in exclude_categories}
                     excluded_category_ids = [
                         cat['id'] for cat in categories 
-                        if cat['slug'] in exclude_categories or cat['name'].lower() in [ec.lower() for ec in exclude_categories]
+                        if cat['slug'] in exclude_slugs or cat['name'].lower() in exclude_names
                     ]
             except Exception as e:
                 logger.warning(f"Could not fetch categories: {e}")
         
-        for post_type in post_types:
-            try:
-                page = 1
-                while True:
-                    params = {
-                        'per_page': per_page,
-                        'page': page,
-                        'status': 'publish',
-                        '_embed': True,
-                        'orderby': 'modified',
-                        'order': 'desc'
-                    }
-                    
-                    # Add category exclusion
-                    if excluded_category_ids:
-                        params['categories_exclude'] = ','.join(map(str, excluded_category_ids))
-                    
+        base_params = {
+            'per_page': per_page,
+            'status': 'publish',
+            '_embed': True,
+            'orderby': 'modified',
+            'order': 'desc'
+        }
+        
+        # Add category exclusion
+        if excluded_category_ids:
+            base_params['categories_exclude'] = ','.join(map(str, excluded_category_ids))
+        
+        max_workers = config.get('performance', {}).get('max_workers', 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Request the first page of every post type in one concurrent round trip
+            logger.info(f"Fetching page 1 of {', '.join(post_types)} from WordPress API...")
+            first_pages = {
+                post_type: executor.submit(self._fetch_posts_page, f"{api_url}/{post_type}", base_params, 1)
+                for post_type in post_types
+            }
+            
+            for post_type in post_types:
+                try:
                     endpoint = f"{api_url}/{post_type}"
-                    logger.info(f"Fetching {post_type} page {page} from WordPress API...")
-                    
-                    response = self.session.get(endpoint, params=params, timeout=30)
-                    response.raise_for_status()
-                    
-                    posts = response.json()
-                    if not posts:
-                        break
-                    
-                    for post in posts:
-                        try:
-                            item = self._process_wordpress_post(post, post_type)
-                            if item:
-                                items.append(item)
-                        except Exception as e:
-                            logger.warning(f"Error processing post {post.get('id', 'unknown')}: {e}")
+                    posts, total_pages = first_pages[post_type].result()
                     
-                    # Check if there are more pages
-                    total_pages = int(response.headers.get('X-WP-TotalPages', 1))
-                    if page >= total_pages:
-                        break
+                    # Page 1 tells us how many pages exist; fetch the rest concurrently
+                    if total_pages > 1:
+                        logger.info(f"Fetching {post_type} pages 2-{total_pages} from WordPress API...")
+                    remaining_pages = executor.map(
+                        lambda page: self._fetch_posts_page(endpoint, base_params, page)[0],
+                        range(2, total_pages + 1)
+                    )
                     
-                    page += 1
-                    time.sleep(0.1)  # Rate limiting
-                    
-            except Exception as e:
-                logger.error(f"Error extracting WordPress {post_type}: {e}")
+                    for page_posts in chain([posts], remaining_pages):
+                        for post in page_posts:
+                            try:
+                                item = self._process_wordpress_post(post, post_type)
+                                if item:
+                                    items.append(item)
+                            except Exception as e:
+                                logger.warning(f"Error processing post {post.get('id', 'unknown')}: {e}")
+                        
+                except Exception as e:
+                    logger.error(f"Error extracting WordPress {post_type}: {e}")
         
         logger.info(f"Extracted {len(items)} items from WordPress")
         return items
     
+    def _fetch_posts_page(self, endpoint: str, params: Dict, page: int) -> Tuple[List[Dict], int]:
+        """Fetch one page of posts, returning the posts and the total page count"""
+        response = self.session.get(endpoint, params={**params, 'page': page}, timeout=30)
+        response.raise_for_status()
+        return _json_loads(response.content), int(response.headers.get('X-WP-TotalPages', 1))
+    
     def _process_wordpress_post(self, post: Dict, post_type: str) -> Optional[ContentItem]:
         """Process a single WordPress post"""
         try:
             # Extract basic information
-            title = self._clean_html(post['title']['rendered'])
+            title = self._strip_tags(post['title']['rendered'])
             if not title:
                 return None
             
@@ -311,13 +622,12 @@ class WordPressExtractor(ContentExtractor):
             
             # Extract and clean content
             content_html = post.get('content', {}).get('rendered', '')
-            content_text = self._clean_html(content_html)
-            word_count = len(content_text.split()) if content_text else 0
+            content_text, word_count = self._extract_text(content_html)
             
             # Extract description from excerpt or content
             description = None
             if post.get('excerpt', {}).get('rendered'):
-                description = self._clean_html(post['excerpt']['rendered'])
+                description = self._strip_tags(post['excerpt']['rendered'])
             elif content_text:
                 description = content_text[:300] + '...' if len(content_text) > 300 else content_text
             
@@ -363,6 +673,9 @@ class WordPressExtractor(ContentExtractor):
 class StaticSiteExtractor(ContentExtractor):
     """Extract content from static sites (markdown files, etc.)"""
     
+    # ((content_dir, file_patterns), files) from the last content_signature() walk
+    _last_scan: Optional[Tuple[Tuple[Path, Tuple[str, ...]], List[Tuple[Path, float]]]] = None
+    
     def get_name(self) -> str:
         return "static"
     
@@ -386,33 +699,87 @@ class StaticSiteExtractor(ContentExtractor):
             logger.warning(f"Content directory not found: {content_dir}")
             return items
         
-        # Find all matching files
-        all_files = []
-        for pattern in file_patterns:
-            all_files.extend(content_dir.rglob(pattern))
+        # Find all matching files, reusing the walk this run's content_signature() just did
+        scan_key = (content_dir, tuple(file_patterns))
+        last_scan, self._last_scan = self._last_scan, None
+        all_files = last_scan[1] if last_scan and last_scan[0] == scan_key else self._scan_files(content_dir, file_patterns)
         
         logger.info(f"Found {len(all_files)} files to process")
         
-        # Process files with threading for better performance
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_file = {
-                executor.submit(self._process_static_file, file_path, content_dir, base_url, exclude_patterns): file_path 
-                for file_path in all_files
-            }
-            
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    item = future.result()
-                    if item:
-                        items.append(item)
-                except Exception as e:
-                    logger.warning(f"Error processing {file_path}: {e}")
+        # Process files concurrently on a single event loop
+        max_concurrency = static_config.get('max_concurrency', 32)
+        results = asyncio.run(self._process_static_files(
+            all_files, content_dir, base_url, exclude_patterns, max_concurrency
+        ))
+        
+        for (file_path, _), result in zip(all_files, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error processing {file_path}: {result}")
+            elif result:
+                items.append(result)
         
         logger.info(f"Extracted {len(items)} items from static site")
         return items
     
-    def _process_static_file(self, file_path: Path, content_dir: Path, base_url: str, exclude_patterns: List[str]) -> Optional[ContentItem]:
+    def content_signature(self, config: Dict) -> Optional[str]:
+        """Digest of the path and mtime of every matching file, so edits, additions and deletions all show up"""
+        static_config = config.get('static', {})
+        content_dir = Path(static_config.get('content_directory', './content'))
+        if not content_dir.exists():
+            return None
+        
+        file_patterns = static_config.get('file_patterns', ['*.md', '*.html'])
+        files = self._scan_files(content_dir, file_patterns)
+        # Handed to the extract_content() call that follows, so a run walks the tree only once
+        self._last_scan = ((content_dir, tuple(file_patterns)), files)
+        signature = hashlib.blake2b(digest_size=16)
+        for file_path, mtime in sorted(files):
+            signature.update(f"{file_path}\0{mtime!r}\n".encode('utf-8', 'surrogateescape'))
+        return signature.hexdigest()
+    
+    def discard_signature_state(self):
+        self._last_scan = None
+    
+    def _scan_files(self, content_dir: Path, file_patterns: List[str]) -> List[Tuple[Path, float]]:
+        """Walk content_dir once with os.scandir, returning matching files and their mtimes"""
+        matches = []
+        pending = [content_dir]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            file_path = Path(entry.path)
+                            if any(file_path.match(pattern) for pattern in file_patterns):
+                                # DirEntry caches stat, so this is the only stat per file
+                                matches.append((file_path, entry.stat().st_mtime))
+            except OSError as e:
+                logger.warning(f"Could not scan directory: {e}")
+        return matches
+    
+    async def _process_static_files(self, files: List[Tuple[Path, float]], content_dir: Path, base_url: str,
+                                    exclude_patterns: List[str], max_concurrency: int) -> List[Any]:
+        """Process static files concurrently, bounded by a semaphore"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(file_path: Path, mtime: float) -> Optional[ContentItem]:
+            async with semaphore:
+                return await self._process_static_file(file_path, content_dir, base_url, exclude_patterns, mtime)
+        
+        return await asyncio.gather(*(bounded(file_path, mtime) for file_path, mtime in files), return_exceptions=True)
+    
+    async def _read_text(self, file_path: Path) -> str:
+        """Read a text file without blocking the event loop"""
+        if aiofiles is not None:
+            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                return await f.read()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, file_path.read_text, 'utf-8')
+    
+    async def _process_static_file(self, file_path: Path, content_dir: Path, base_url: str, exclude_patterns: List[str],
+                                   mtime: Optional[float] = None) -> Optional[ContentItem]:
         """Process a single static file"""
         try:
             # Check exclude patterns
@@ -420,8 +787,7 @@ class StaticSiteExtractor(ContentExtractor):
                 if file_path.match(exclude_pattern):
                     return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
+            file_content = await self._read_text(file_path)
             
             # Parse frontmatter if present
             post = frontmatter.loads(file_content)
@@ -432,7 +798,7 @@ class StaticSiteExtractor(ContentExtractor):
             title = metadata.get('title')
             if not title:
                 # Try to extract from first h1
-                h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+                h1_match = _H1_RE.search(content)
                 if h1_match:
                     title = h1_match.group(1).strip()
                 else:
@@ -450,8 +816,8 @@ class StaticSiteExtractor(ContentExtractor):
             
             # Clean content and calculate word count
             clean_content = self._clean_html(content) if file_path.suffix == '.html' else content
-            clean_content = re.sub(r'!\[.*?\]\(.*?\)', '', clean_content)  # Remove markdown images
-            clean_content = re.sub(r'\[.*?\]\(.*?\)', '', clean_content)   # Remove markdown links
+            clean_content = _MD_IMG_RE.sub('', clean_content)  # Remove markdown images
+            clean_content = _MD_LINK_RE.sub('', clean_content)   # Remove markdown links
             word_count = len(clean_content.split())
             
             # Skip if below minimum word count
@@ -466,7 +832,7 @@ class StaticSiteExtractor(ContentExtractor):
             
             # Auto-generate description if not provided
             if not description and clean_content:
-                sentences = re.split(r'[.!?]+', clean_content)
+                sentences = _SENTENCE_RE.split(clean_content)
                 if sentences:
                     description = sentences[0].strip()[:200]
                     if len(description) < len(sentences[0].strip()):
@@ -487,7 +853,7 @@ class StaticSiteExtractor(ContentExtractor):
                 description=description,
                 author=author,
                 last_modified=datetime.datetime.fromtimestamp(
-                    file_path.stat().st_mtime
+                    file_path.stat().st_mtime if mtime is None else mtime
                 ).isoformat(),
                 tags=tags,
                 word_count=word_count,
@@ -510,6 +876,51 @@ class SitemapExtractor(ContentExtractor):
     def get_name(self) -> str:
         return "sitemap"
     
+    def content_signature(self, config: Dict) -> Optional[str]:
+        """ETag or Last-Modified of the sitemap and, for a sitemap index, of every sub-sitemap.
+        
+        The sitemap itself is only streamed as far as its first entry unless it turns out
+        to be an index; sub-sitemaps are probed with concurrent HEAD requests.
+        """
+        sitemap_config = config.get('sitemap', {})
+        sitemap_url = sitemap_config.get('url', 'auto')
+        if sitemap_url == 'auto':
+            sitemap_url = f"{config['site_url'].rstrip('/')}/sitemap.xml"
+        timeout = sitemap_config.get('timeout', 30)
+        
+        with self.session.get(sitemap_url, timeout=timeout, stream=True) as response:
+            if not response.ok:
+                return None
+            validators = [self._validator(sitemap_url, response)]
+            if validators[0] is None:
+                # Already no signature, so don't parse the body or probe sub-sitemaps
+                return None
+            response.raw.decode_content = True
+            entries = self._iter_sitemap(response.raw)
+            first = next(entries, None)
+            sub_sitemap_urls = []
+            if first and first[0] == 'sitemap':
+                sub_sitemap_urls = [loc for tag, loc, _ in chain([first], entries) if tag == 'sitemap' and loc]
+        
+        if sub_sitemap_urls:
+            def head(sub_sitemap_url: str) -> Optional[str]:
+                sub_response = self.session.head(sub_sitemap_url, timeout=timeout, allow_redirects=True)
+                return self._validator(sub_sitemap_url, sub_response) if sub_response.ok else None
+            
+            workers = min(sitemap_config.get('max_workers', 10), len(sub_sitemap_urls))
+            validators.extend(self.io_map(head, sub_sitemap_urls, workers=workers))
+        
+        # A sub-sitemap without validators could change unseen, so no signature at all
+        if None in validators:
+            return None
+        return '\n'.join(validators)
+    
+    @staticmethod
+    def _validator(url: str, response: requests.Response) -> Optional[str]:
+        """`url` tagged with the response's ETag or Last-Modified, or None if it has neither"""
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        return f"{url} {validator}" if validator else None
+    
     def extract_content(self, config: Dict) -> List[ContentItem]:
         items = []
         site_url = config['site_url'].rstrip('/')
@@ -524,25 +935,24 @@ class SitemapExtractor(ContentExtractor):
         
         try:
             logger.info(f"Fetching sitemap from: {sitemap_url}")
-            response = self.session.get(sitemap_url, timeout=timeout)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.content)
-            
-            # Handle different sitemap formats
-            namespaces = {
-                'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9',
-                'news': 'http://www.google.com/schemas/sitemap-news/0.9',
-                'image': 'http://www.google.com/schemas/sitemap-image/1.1'
-            }
-            
-            # Check if this is a sitemap index
-            if root.tag.endswith('sitemapindex'):
-                logger.info("Processing sitemap index...")
-                items = self._process_sitemap_index(root, namespaces, max_urls, timeout)
-            else:
-                logger.info("Processing single sitemap...")
-                items = self._extract_from_urlset(root, namespaces, max_urls)
+            with self.session.get(sitemap_url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                entries = self._iter_sitemap(response.raw)
+                first = next(entries, None)
+                entries = chain([first], entries) if first else iter(())
+                
+                # Check if this is a sitemap index
+                if first and first[0] == 'sitemap':
+                    logger.info("Processing sitemap index...")
+                    sub_sitemap_urls = [loc for tag, loc, _ in entries if tag == 'sitemap' and loc]
+                    items = self._process_sitemap_index(
+                        sub_sitemap_urls, max_urls, timeout, sitemap_config.get('max_workers', 10)
+                    )
+                else:
+                    logger.info("Processing single sitemap...")
+                    items = self._extract_from_urlset(entries, max_urls)
                     
         except Exception as e:
             logger.error(f"Error extracting from sitemap: {e}")
@@ -550,59 +960,81 @@ class SitemapExtractor(ContentExtractor):
         logger.info(f"Extracted {len(items)} items from sitemap")
         return items
     
-    def _process_sitemap_index(self, root: ET.Element, namespaces: Dict, max_urls: int, timeout: int) -> List[ContentItem]:
-        """Process sitemap index file"""
+    def _iter_sitemap(self, source) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Stream (tag, loc, lastmod) for each <url>/<sitemap> entry, discarding parsed elements"""
+        url_tag = f'{{{SITEMAP_NS}}}url'
+        sitemap_tag = f'{{{SITEMAP_NS}}}sitemap'
+        loc_tag = f'{{{SITEMAP_NS}}}loc'
+        lastmod_tag = f'{{{SITEMAP_NS}}}lastmod'
+        
+        if lxml_etree is not None:
+            context = lxml_etree.iterparse(source, events=('end',), tag=(url_tag, sitemap_tag),
+                                           resolve_entities=False)
+            for _, elem in context:
+                loc = elem.findtext(loc_tag)
+                yield elem.tag.rpartition('}')[2], loc.strip() if loc else None, elem.findtext(lastmod_tag)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            return
+        
+        root = None
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if root is None:
+                root = elem
+            if event != 'end' or elem.tag not in (url_tag, sitemap_tag):
+                continue
+            loc = elem.findtext(loc_tag)
+            yield elem.tag.rpartition('}')[2], loc.strip() if loc else None, elem.findtext(lastmod_tag)
+            root.clear()
+    
+    def _process_sitemap_index(self, sub_sitemap_urls: List[str], max_urls: int, timeout: int,
+                               max_workers: int = 10) -> List[ContentItem]:
+        """Process sitemap index file, fetching sub-sitemaps concurrently"""
         items = []
-        processed_urls = 0
+        if not sub_sitemap_urls:
+            return items
         
-        for sitemap_elem in root.findall('ns:sitemap', namespaces):
-            if processed_urls >= max_urls:
-                break
-                
-            loc = sitemap_elem.find('ns:loc', namespaces)
-            if loc is not None:
-                sub_sitemap_url = loc.text
-                try:
-                    logger.info(f"Processing sub-sitemap: {sub_sitemap_url}")
-                    sub_response = self.session.get(sub_sitemap_url, timeout=timeout)
-                    sub_response.raise_for_status()
-                    sub_root = ET.fromstring(sub_response.content)
-                    
-                    remaining_urls = max_urls - processed_urls
-                    sub_items = self._extract_from_urlset(sub_root, namespaces, remaining_urls)
-                    items.extend(sub_items)
-                    processed_urls += len(sub_items)
-                    
-                    time.sleep(0.1)  # Rate limiting
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing sub-sitemap {sub_sitemap_url}: {e}")
+        def fetch(sub_sitemap_url: str) -> List[ContentItem]:
+            try:
+                return self._fetch_urlset(sub_sitemap_url, max_urls, timeout)
+            except Exception as e:
+                logger.warning(f"Error processing sub-sitemap {sub_sitemap_url}: {e}")
+                return []
+        
+        # Results arrive in index order so max_urls truncation is deterministic;
+        # closing the iterator once the limit is hit cancels the remaining fetches
+        results = self.io_map(fetch, sub_sitemap_urls, workers=min(max_workers, len(sub_sitemap_urls)))
+        try:
+            for sub_items in results:
+                items.extend(sub_items[:max_urls - len(items)])
+                if len(items) >= max_urls:
+                    break
+        finally:
+            results.close()
         
         return items
     
-    def _extract_from_urlset(self, root: ET.Element, namespaces: Dict, max_urls: int) -> List[ContentItem]:
-        """Extract items from a urlset element"""
+    def _fetch_urlset(self, sitemap_url: str, max_urls: int, timeout: int) -> List[ContentItem]:
+        """Fetch and parse a single urlset sitemap"""
+        logger.info(f"Processing sub-sitemap: {sitemap_url}")
+        with self.session.get(sitemap_url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return self._extract_from_urlset(self._iter_sitemap(response.raw), max_urls)
+    
+    def _extract_from_urlset(self, entries: Iterable[Tuple[str, Optional[str], Optional[str]]], max_urls: int) -> List[ContentItem]:
+        """Extract items from streamed urlset entries"""
         items = []
         processed = 0
         
-        for url_elem in root.findall('ns:url', namespaces):
+        for tag, url, lastmod in entries:
             if processed >= max_urls:
                 break
                 
-            loc = url_elem.find('ns:loc', namespaces)
-            lastmod = url_elem.find('ns:lastmod', namespaces)
-            
-            if loc is not None:
-                url = loc.text
-                
+            if tag == 'url' and url:
                 # Skip non-content URLs
-                skip_patterns = [
-                    '/admin', '/api', '/wp-admin', '/wp-content', '/wp-includes',
-                    '.xml', '.js', '.css', '.png', '.jpg', '.jpeg', '.gif', '.svg',
-                    '/feed', '/rss', '/sitemap', '/robots.txt'
-                ]
-                
-                if any(skip in url.lower() for skip in skip_patterns):
+                if _SITEMAP_SKIP_RE.search(url):
                     continue
                 
                 # Extract title from URL path
@@ -617,16 +1049,13 @@ class SitemapExtractor(ContentExtractor):
                     title = "Home Page"
                 
                 # Determine content type based on URL
-                content_type = 'page'
-                blog_indicators = ['/blog/', '/post/', '/article/', '/news/', '/press/']
-                if any(indicator in url.lower() for indicator in blog_indicators):
-                    content_type = 'article'
+                content_type = 'article' if _BLOG_URL_RE.search(url) else 'page'
                 
                 item = ContentItem(
                     title=title,
                     url=url,
                     content_type=content_type,
-                    last_modified=lastmod.text if lastmod is not None else None
+                    last_modified=lastmod
                 )
                 items.append(item)
                 processed += 1
@@ -640,11 +1069,18 @@ class LLMsTxtGenerator:
     def __init__(self, config_path: str = "llms_config.yaml", config_dict: Optional[Dict] = None):
         self.config_path = config_path
         self.config = config_dict or self.load_config()
+        # One pooled session shared by every built-in extractor, created on first request
+        self.session = _LazySession(lambda: create_session(
+            cache_duration=self.config.get('cache_duration', 3600),
+            cache_name=self.config.get('http_cache_file', '.llms_http_cache'),
+        ))
         self.extractors = {
-            'wordpress': WordPressExtractor(),
-            'static': StaticSiteExtractor(),
-            'sitemap': SitemapExtractor(),
+            'wordpress': WordPressExtractor(self.session),
+            'static': StaticSiteExtractor(self.session),
+            'sitemap': SitemapExtractor(self.session),
         }
+        for extractor in self.extractors.values():
+            extractor.io_map = self._map_io
         
         # Setup logging from config
         log_config = self.config.get('logging', {})
@@ -692,7 +1128,7 @@ class LLMsTxtGenerator:
             'max_items': 1000,
             'min_word_count': 50,
             'include_drafts': False,
-            'cache_file': '.llms_cache.json',
+            'cache_file': '.llms_cache',
             'cache_duration': 3600,
             'include_patterns': ['*.html', '*.md'],
             'exclude_patterns': ['admin/*', 'private/*', 'draft/*'],
@@ -721,7 +1157,7 @@ class LLMsTxtGenerator:
             'max_items': 1000,
             'min_word_count': 50,
             'include_drafts': False,
-            'cache_file': '.llms_cache.json',
+            'cache_file': '.llms_cache',
             'cache_duration': 3600,
             'include_patterns': ['*.html', '*.md'],
             'exclude_patterns': ['admin/*', 'private/*', 'draft/*'],
@@ -760,6 +1196,7 @@ class LLMsTxtGenerator:
             },
             'performance': {
                 'max_workers': 4,
+                'io_batch_size': 100,
                 'request_delay': 0.1,
                 'retry_attempts': 3,
                 'retry_delay': 1
@@ -776,9 +1213,9 @@ class LLMsTxtGenerator:
             
         return default_config
     
-    def generate_header(self) -> str:
+    def generate_header(self, now: Optional[datetime.datetime] = None) -> str:
         """Generate llms.txt header"""
-        timestamp = datetime.datetime.now().isoformat()
+        timestamp = (now or datetime.datetime.now()).isoformat()
         header = f"""# LLMs.txt for {self.config['site_name']}
 #
 # Generated on: {timestamp}
@@ -800,152 +1237,172 @@ class LLMsTxtGenerator:
     
     def get_content_hash(self, items: List[ContentItem]) -> str:
         """Generate hash of content for change detection"""
-        content_str = json.dumps([asdict(item) for item in items], sort_keys=True, default=str)
-        return hashlib.md5(content_str.encode()).hexdigest()
+        # Roll up the cached per-item fingerprints in output order, so reordering also counts as a change
+        content_hash = hashlib.blake2b(digest_size=16)
+        for item in items:
+            content_hash.update(item.fingerprint)
+        return content_hash.hexdigest()
     
-    def load_cache(self) -> Dict:
+    def load_cache(self, now: Optional[datetime.datetime] = None) -> Dict:
         """Load cache file"""
         cache_file = Path(self.config['cache_file'])
         if cache_file.exists():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache = json.load(f)
+                cache = _cache_loads(cache_file.read_bytes())
                     
                 # Check if cache is still valid
                 cache_duration = self.config.get('cache_duration', 3600)
                 if cache.get('timestamp'):
                     cache_time = datetime.datetime.fromisoformat(cache['timestamp'])
-                    if (datetime.datetime.now() - cache_time).total_seconds() > cache_duration:
+                    if ((now or datetime.datetime.now()) - cache_time).total_seconds() > cache_duration:
                         return {}
+                # Rendered blocks depend on to_llms_format(), so only reuse those from this version
+                if cache.get('generator_version') != __version__:
+                    cache.pop('fragments', None)
                 return cache
             except Exception as e:
                 self.logger.warning(f"Error loading cache: {e}")
         return {}
     
-    def save_cache(self, cache_data: Dict):
+    def save_cache(self, cache_data: Dict, now: Optional[datetime.datetime] = None):
         """Save cache file"""
-        cache_data['timestamp'] = datetime.datetime.now().isoformat()
+        cache_data['timestamp'] = (now or datetime.datetime.now()).isoformat()
         cache_data['generator_version'] = __version__
+        cache_file = self.config['cache_file']
         try:
-            with open(self.config['cache_file'], 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            with open(cache_file, 'wb') as f:
+                f.write(_cache_dumps(cache_data, _cache_format(cache_file)))
         except Exception as e:
             self.logger.error(f"Error saving cache: {e}")
     
-    def backup_file(self, file_path: Union[str, Path]):
+    def backup_file(self, file_path: Union[str, Path], now: Optional[datetime.datetime] = None):
         """Create backup of a file"""
         if not self.config.get('backup_files', True):
             return
             
         file_path = Path(file_path)
         if file_path.exists():
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = (now or datetime.datetime.now()).strftime('%Y%m%d_%H%M%S')
             backup_path = file_path.with_suffix(f"{file_path.suffix}.backup_{timestamp}")
             try:
-                shutil.copy2(file_path, backup_path)
+                # A hard link is an O(1) snapshot because updates replace the file rather than rewrite it
+                try:
+                    os.link(file_path, backup_path)
+                except OSError:
+                    shutil.copy2(file_path, backup_path)
                 self.logger.info(f"Created backup: {backup_path}")
             except Exception as e:
                 self.logger.warning(f"Failed to create backup for {file_path}: {e}")
     
-    def update_sitemap(self, llms_txt_url: str):
+    def update_sitemap(self, llms_txt_url: str, now: Optional[datetime.datetime] = None):
         """Update sitemap.xml to include llms.txt"""
         if not self.config.get('auto_update_sitemap', True):
             return
             
-        # Common sitemap paths
-        sitemap_paths = ['sitemap.xml', 'sitemap_index.xml', 'public/sitemap.xml', 'static/sitemap.xml']
+        # Common sitemap locations, looked up with one directory scan each
+        sitemap_file = _find_first(('sitemap.xml', 'sitemap_index.xml'))
+        if sitemap_file is None:
+            return
         
-        for sitemap_path in sitemap_paths:
-            sitemap_file = Path(sitemap_path)
-            if sitemap_file.exists():
-                try:
-                    self.backup_file(sitemap_file)
-                    
-                    # Parse existing sitemap
-                    tree = ET.parse(sitemap_file)
-                    root = tree.getroot()
-                    
-                    # Check if llms.txt is already in sitemap
-                    namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-                    
-                    # Register namespace to avoid ns0 prefix
-                    ET.register_namespace('', 'http://www.sitemaps.org/schemas/sitemap/0.9')
-                    
-                    existing_urls = []
-                    for url_elem in root.findall('ns:url', namespace):
-                        loc = url_elem.find('ns:loc', namespace)
-                        if loc is not None:
-                            existing_urls.append(loc.text)
-                    
-                    if llms_txt_url not in existing_urls:
-                        # Add llms.txt to sitemap
-                        url_elem = ET.SubElement(root, 'url')
-                        loc_elem = ET.SubElement(url_elem, 'loc')
-                        loc_elem.text = llms_txt_url
-                        
-                        lastmod_elem = ET.SubElement(url_elem, 'lastmod')
-                        lastmod_elem.text = datetime.datetime.now().strftime('%Y-%m-%d')
-                        
-                        changefreq_elem = ET.SubElement(url_elem, 'changefreq')
-                        changefreq_elem.text = 'daily'
-                        
-                        priority_elem = ET.SubElement(url_elem, 'priority')
-                        priority_elem.text = '0.8'
-                        
-                        # Write updated sitemap
-                        tree.write(sitemap_file, encoding='utf-8', xml_declaration=True)
-                        self.logger.info(f"Updated sitemap: {sitemap_file}")
-                    else:
-                        self.logger.info(f"LLMs.txt already exists in sitemap: {sitemap_file}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error updating sitemap {sitemap_file}: {e}")
-                break
+        try:
+            # Check if llms.txt is already in sitemap
+            if self._sitemap_contains(sitemap_file, llms_txt_url):
+                self.logger.info(f"LLMs.txt already exists in sitemap: {sitemap_file}")
+                return
+            
+            # Splice the new entry in before the closing tag instead of re-serialising the tree
+            data = sitemap_file.read_bytes()
+            idx = data.rfind(b'</urlset>')
+            if idx == -1:
+                self.logger.warning(f"No </urlset> found in sitemap, not updating: {sitemap_file}")
+                return
+            
+            # Build llms.txt's <url> entry and serialise just that element
+            url_elem = ET.Element('url')
+            ET.SubElement(url_elem, 'loc').text = llms_txt_url
+            if now is None:
+                now = datetime.datetime.now()
+            ET.SubElement(url_elem, 'lastmod').text = now.date().isoformat()
+            ET.SubElement(url_elem, 'changefreq').text = 'daily'
+            ET.SubElement(url_elem, 'priority').text = '0.8'
+            new_block = ET.tostring(url_elem, encoding='utf-8') + b'\n'
+            
+            self.backup_file(sitemap_file, now)
+            
+            # Write updated sitemap
+            _atomic_write_bytes(sitemap_file, data[:idx] + new_block + data[idx:])
+            self.logger.info(f"Updated sitemap: {sitemap_file}")
+            
+        except Exception as e:
+            self.logger.error(f"Error updating sitemap {sitemap_file}: {e}")
+    
+    def _sitemap_contains(self, sitemap_file: Path, url: str) -> bool:
+        """Stream through a sitemap looking for `url` without building the whole tree"""
+        entry_tags = (f'{{{SITEMAP_NS}}}url', f'{{{SITEMAP_NS}}}sitemap')
+        loc_tag = f'{{{SITEMAP_NS}}}loc'
+        # Finished entries are detached from the root as in SitemapExtractor._iter_sitemap,
+        # so memory stays flat however many <url> elements the file holds
+        with open(sitemap_file, 'rb') as f:
+            if lxml_etree is not None:
+                for _, elem in lxml_etree.iterparse(f, events=('end',), tag=entry_tags, resolve_entities=False):
+                    if elem.findtext(loc_tag) == url:
+                        return True
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                return False
+            
+            root = None
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if root is None:
+                    root = elem
+                if event != 'end' or elem.tag not in entry_tags:
+                    continue
+                if elem.findtext(loc_tag) == url:
+                    return True
+                root.clear()
+        return False
     
-    def update_robots_txt(self, llms_txt_url: str):
+    def update_robots_txt(self, llms_txt_url: str, now: Optional[datetime.datetime] = None):
         """Update robots.txt to include llms.txt"""
         if not self.config.get('auto_update_robots', True):
             return
             
-        robots_paths = ['robots.txt', 'public/robots.txt', 'static/robots.txt']
+        robots_file = _find_first(('robots.txt',))
         
-        for robots_path in robots_paths:
-            robots_file = Path(robots_path)
-            
-            # Create robots.txt if it doesn't exist
-            if not robots_file.exists():
-                robots_file.parent.mkdir(parents=True, exist_ok=True)
-                robots_file.touch()
+        # Create robots.txt if it doesn't exist
+        if robots_file is None:
+            robots_file = Path('robots.txt')
+            robots_file.touch()
+        
+        try:
+            # Read existing robots.txt as raw bytes; the check below needs no decode
+            data = robots_file.read_bytes()
             
-            try:
-                self.backup_file(robots_file)
+            # Check if llms.txt is already referenced
+            if not _LLMS_TXT_RE.search(data):
+                # Add llms.txt reference
+                if not data.endswith(b'\n'):
+                    data += b'\n'
                 
-                # Read existing robots.txt
-                with open(robots_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                data += (
+                    b"\n# LLMs.txt for AI and language models\n"
+                    b"# Learn more: https://llmstxt.org/\n"
+                    b"# Generated by: https://github.com/AsifMinar/Universal-LLMS.txt-Generator\n"
+                    b"Allow: /llms.txt\n"
+                )
                 
-                # Check if llms.txt is already referenced
-                if 'llms.txt' not in content.lower():
-                    # Add llms.txt reference
-                    if not content.endswith('\n'):
-                        content += '\n'
-                    
-                    content += f"\n# LLMs.txt for AI and language models\n"
-                    content += f"# Learn more: https://llmstxt.org/\n"
-                    content += f"# Generated by: https://github.com/AsifMinar/Universal-LLMS.txt-Generator\n"
-                    content += f"Allow: /llms.txt\n"
-                    
-                    # Write updated robots.txt
-                    with open(robots_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    
-                    self.logger.info(f"Updated robots.txt: {robots_file}")
-                else:
-                    self.logger.info(f"LLMs.txt already exists in robots.txt: {robots_file}")
+                self.backup_file(robots_file, now)
                 
-            except Exception as e:
-                self.logger.error(f"Error updating robots.txt {robots_file}: {e}")
-            break
+                # Write updated robots.txt
+                _atomic_write_bytes(robots_file, data)
+                
+                self.logger.info(f"Updated robots.txt: {robots_file}")
+            else:
+                self.logger.info(f"LLMs.txt already exists in robots.txt: {robots_file}")
+            
+        except Exception as e:
+            self.logger.error(f"Error updating robots.txt {robots_file}: {e}")
     
     def validate_config(self) -> bool:
         """Validate configuration"""
@@ -956,32 +1413,82 @@ class LLMsTxtGenerator:
                 self.logger.error(f"Missing required config field: {field}")
                 return False
         
-        extractor_name = self.config['extractor']
-        if extractor_name not in self.extractors:
-            self.logger.error(f"Unknown extractor: {extractor_name}")
+        extractor_names = self._get_extractor_names()
+        if not extractor_names:
+            self.logger.error("No extractor configured")
             return False
         
-        # Validate extractor-specific config
-        extractor = self.extractors[extractor_name]
-        if not extractor.validate_config(self.config):
-            return False
+        for extractor_name in extractor_names:
+            if extractor_name not in self.extractors:
+                self.logger.error(f"Unknown extractor: {extractor_name}")
+                return False
+            
+            # Validate extractor-specific config
+            extractor = self.extractors[extractor_name]
+            if not extractor.validate_config(self.config):
+                return False
         
         return True
     
+    def _get_extractor_names(self) -> List[str]:
+        """Get the configured extractor names ('extractor' may be a single name or a list)"""
+        extractor = self.config.get('extractor')
+        if not extractor:
+            return []
+        return [extractor] if isinstance(extractor, str) else list(extractor)
+    
+    def _extract_items(self, extractor_names: List[str]) -> List[ContentItem]:
+        """Run the named extractors, concurrently when there are several, merging items by URL"""
+        if len(extractor_names) == 1:
+            return self.extractors[extractor_names[0]].extract_content(self.config)
+        
+        with ThreadPoolExecutor(max_workers=len(extractor_names)) as executor:
+            futures = [
+                (name, executor.submit(self.extractors[name].extract_content, self.config))
+                for name in extractor_names
+            ]
+            results = []
+            for name, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Error extracting content with {name} extractor: {e}")
+        
+        # Earlier extractors in the config win when several report the same URL
+        items = []
+        seen_urls = set()
+        for item in chain.from_iterable(results):
+            if item.url not in seen_urls:
+                seen_urls.add(item.url)
+                items.append(item)
+        return items
+    
     def generate_llms_txt(self, force_update: bool = False) -> bool:
         """Generate llms.txt file"""
         if not self.validate_config():
             return False
             
-        extractor_name = self.config['extractor']
-        extractor = self.extractors[extractor_name]
+        extractor_names = self._get_extractor_names()
+        extractor_name = ', '.join(extractor_names)
         
-        self.logger.info(f"Using {extractor.get_name()} extractor...")
+        self.logger.info(f"Using {', '.join(self.extractors[name].get_name() for name in extractor_names)} extractor...")
         start_time = time.time()
+        now = datetime.datetime.now()
+        output_path = Path(self.config['output_path'])
+        cache = self.load_cache(now)
+        
+        # Skip extraction entirely when the extractors can tell cheaply that nothing changed
+        signature = self._content_signature(extractor_names)
+        if not force_update and signature and cache.get('signature') == signature and output_path.exists():
+            self.logger.info("Source unchanged since last run, skipping extraction")
+            for name in extractor_names:
+                self.extractors[name].discard_signature_state()
+            return False
         
-        # Extract content
+        # Extract content; a forced run must see the live source, so skip the HTTP cache
         try:
-            items = extractor.extract_content(self.config)
+            with self.session.cache_disabled() if force_update else nullcontext():
+                items = self._extract_items(extractor_names)
         except Exception as e:
             self.logger.error(f"Error extracting content: {e}")
             return False
@@ -999,49 +1506,83 @@ class LLMsTxtGenerator:
         
         # Check if content changed
         content_hash = self.get_content_hash(filtered_items)
-        cache = self.load_cache()
         
         if not force_update and cache.get('content_hash') == content_hash:
             self.logger.info("Content unchanged, skipping update")
+            if signature and cache.get('signature') != signature:
+                # Remember the new signature so the next run can skip extraction
+                cache['signature'] = signature
+                self.save_cache(cache, now)
             return False
         
-        # Generate llms.txt content
-        content = self._generate_llms_content(filtered_items)
+        fingerprints = {item.url: item.fingerprint.hex() for item in filtered_items}
+        self._log_changes(cache.get('fingerprints', {}), fingerprints)
+        
+        # Generate llms.txt content, reusing blocks rendered on the previous run
+        fragments = cache.get('fragments', {})
+        parts = self._generate_llms_parts(filtered_items, fragments, now)
         
         # Write file
-        output_path = Path(self.config['output_path'])
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(parts)
         except Exception as e:
             self.logger.error(f"Error writing llms.txt: {e}")
             return False
         
         # Update sitemap and robots.txt
         llms_txt_url = urljoin(self.config['site_url'], 'llms.txt')
-        self.update_sitemap(llms_txt_url)
-        self.update_robots_txt(llms_txt_url)
+        self.update_sitemap(llms_txt_url, now)
+        self.update_robots_txt(llms_txt_url, now)
         
         # Update cache
         cache.update({
             'content_hash': content_hash,
-            'last_updated': datetime.datetime.now().isoformat(),
+            'signature': signature,
+            'last_updated': now.isoformat(),
             'item_count': len(filtered_items),
             'generation_time': time.time() - start_time,
-            'extractor_used': extractor_name
+            'extractor_used': extractor_name,
+            'fingerprints': fingerprints,
+            'fragments': {digest: fragments[digest] for digest in fingerprints.values() if digest in fragments}
         })
-        self.save_cache(cache)
+        self.save_cache(cache, now)
         
         generation_time = time.time() - start_time
         self.logger.info(f"✅ Generated llms.txt with {len(filtered_items)} items in {generation_time:.2f}s at {output_path}")
         return True
     
+    def _map_io(self, func: Callable[[Any], Any], iterable: Iterable[Any], workers: Optional[int] = None) -> Iterator[Any]:
+        """map_io with worker count and queue depth taken from the performance config"""
+        performance = self.config.get('performance', {})
+        return map_io(func, iterable, workers=workers or performance.get('max_workers'),
+                      window=performance.get('io_batch_size', 100))
+    
+    def _content_signature(self, extractor_names: List[str]) -> Optional[str]:
+        """Combine the extractors' source signatures with the config, or None if any extractor can't provide one"""
+        signature = hashlib.blake2b(digest_size=16)
+        signature.update(__version__.encode('utf-8'))
+        # Filtering and output options change the result too, so the config is part of the signature
+        signature.update(_json_dumps(self.config, sort_keys=True))
+        for name in extractor_names:
+            try:
+                extractor_signature = self.extractors[name].content_signature(self.config)
+            except Exception as e:
+                self.logger.debug(f"Could not compute content signature for {name}: {e}")
+                return None
+            if extractor_signature is None:
+                return None
+            signature.update(f"\0{name}\0{extractor_signature}".encode('utf-8', 'surrogateescape'))
+        return signature.hexdigest()
+    
     def _filter_and_process_items(self, items: List[ContentItem]) -> List[ContentItem]:
         """Filter and process content items"""
         filtered_items = []
         min_word_count = self.config.get('min_word_count', 50)
+        include_drafts = self.config.get('include_drafts', False)
+        draft_search = _DRAFT_RE.search
         
         for item in items:
             # Skip if below minimum word count
@@ -1049,8 +1590,8 @@ class LLMsTxtGenerator:
                 continue
                 
             # Skip drafts if not included
-            if not self.config.get('include_drafts', False):
-                if 'draft' in (item.tags or []) or 'draft' in item.title.lower():
+            if not include_drafts:
+                if 'draft' in (item.tags or []) or draft_search(item.title):
                     continue
             
             filtered_items.append(item)
@@ -1061,12 +1602,17 @@ class LLMsTxtGenerator:
         
         try:
             reverse = sort_order.lower() == 'desc'
-            if sort_by == 'title':
-                filtered_items.sort(key=lambda x: x.title.lower(), reverse=reverse)
-            elif sort_by == 'word_count':
-                filtered_items.sort(key=lambda x: x.word_count or 0, reverse=reverse)
-            elif sort_by == 'last_modified':
-                filtered_items.sort(key=lambda x: x.last_modified or "", reverse=reverse)
+            sort_key = _SORT_KEYS.get(sort_by)
+            if sort_key is not None:
+                # Extract keys once; extractors often return items already in order, so skip the sort then
+                keys = list(map(sort_key, filtered_items))
+                if reverse:
+                    in_order = all(a >= b for a, b in zip(keys, islice(keys, 1, None)))
+                else:
+                    in_order = all(a <= b for a, b in zip(keys, islice(keys, 1, None)))
+                if not in_order:
+                    order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+                    filtered_items = [filtered_items[i] for i in order]
         except Exception as e:
             self.logger.warning(f"Error sorting items: {e}")
         
@@ -1077,44 +1623,72 @@ class LLMsTxtGenerator:
         
         return filtered_items
     
-    def _generate_llms_content(self, items: List[ContentItem]) -> str:
+    def _log_changes(self, previous: Dict[str, str], current: Dict[str, str]):
+        """Log which URLs were added, removed or changed since the previous run"""
+        if not previous:
+            return
+        added = current.keys() - previous.keys()
+        removed = previous.keys() - current.keys()
+        changed = sum(1 for url, digest in current.items() if url in previous and previous[url] != digest)
+        self.logger.info(f"Changes since last run: {len(added)} added, {len(removed)} removed, {changed} changed")
+    
+    def _render_item(self, item: ContentItem, fragments: Optional[Dict[str, str]] = None) -> str:
+        """Render an item, reusing the block memoised on it or cached in `fragments` under its fingerprint"""
+        key = item.fingerprint.hex() if fragments is not None else None
+        block = item._rendered
+        if block is None and key is not None:
+            block = fragments.get(key)
+        if block is None:
+            block = item.to_llms_format()
+        item._rendered = block
+        if key is not None:
+            fragments[key] = block
+        return block
+    
+    def _generate_llms_content(self, items: List[ContentItem], fragments: Optional[Dict[str, str]] = None,
+                               now: Optional[datetime.datetime] = None) -> str:
         """Generate the complete llms.txt content"""
-        content = self.generate_header()
+        return "".join(self._generate_llms_parts(items, fragments, now))
+    
+    def _generate_llms_parts(self, items: List[ContentItem], fragments: Optional[Dict[str, str]] = None,
+                             now: Optional[datetime.datetime] = None) -> List[str]:
+        """Generate the llms.txt content as a list of fragments, ready to be joined or written out"""
+        if now is None:
+            now = datetime.datetime.now()
+        parts = [self.generate_header(now)]
         
         # Add statistics if enabled
         if self.config.get('output', {}).get('include_stats', True):
-            stats = self._generate_statistics(items)
-            content += stats + "\n"
+            parts.append(self._generate_statistics(items, now))
+            parts.append("\n")
         
         # Group by type if enabled
         if self.config.get('output', {}).get('group_by_type', False):
-            content += self._generate_grouped_content(items)
+            parts.append(self._generate_grouped_content(items, fragments))
         else:
             # Add all items
-            for item in items:
-                content += item.to_llms_format()
+            parts.extend(self._render_item(item, fragments) for item in items)
         
         # Add footer
-        content += self._generate_footer(items)
+        parts.append(self._generate_footer(items, now))
         
-        return content
+        return parts
     
-    def _generate_statistics(self, items: List[ContentItem]) -> str:
+    def _generate_statistics(self, items: List[ContentItem], now: Optional[datetime.datetime] = None) -> str:
         """Generate statistics section"""
         total_items = len(items)
-        total_words = sum(item.word_count or 0 for item in items)
-        avg_words = int(total_words / total_items) if total_items > 0 else 0
         
-        # Count by type
+        # Sum words and count by type and language in a single pass
+        total_words = 0
         type_counts = {}
-        for item in items:
-            type_counts[item.content_type] = type_counts.get(item.content_type, 0) + 1
-        
-        # Count by language
         language_counts = {}
         for item in items:
+            total_words += item.word_count or 0
+            content_type = item.content_type
+            type_counts[content_type] = type_counts.get(content_type, 0) + 1
             lang = item.language or 'unknown'
             language_counts[lang] = language_counts.get(lang, 0) + 1
+        avg_words = int(total_words / total_items) if total_items > 0 else 0
         
         stats = f"""# Statistics
 # Total items: {total_items}
@@ -1122,12 +1696,12 @@ class LLMsTxtGenerator:
 # Average words per item: {avg_words}
 # Content types: {', '.join(f"{k}({v})" for k, v in type_counts.items())}
 # Languages: {', '.join(f"{k}({v})" for k, v in language_counts.items())}
-# Last updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+# Last updated: {(now or datetime.datetime.now()).isoformat(sep=' ', timespec='seconds')} UTC
 
 """
         return stats
     
-    def _generate_grouped_content(self, items: List[ContentItem]) -> str:
+    def _generate_grouped_content(self, items: List[ContentItem], fragments: Optional[Dict[str, str]] = None) -> str:
         """Generate content grouped by type"""
         grouped = {}
         for item in items:
@@ -1136,15 +1710,14 @@ class LLMsTxtGenerator:
                 grouped[content_type] = []
             grouped[content_type].append(item)
         
-        content = ""
+        parts = []
         for content_type, type_items in grouped.items():
-            content += f"\n# ========== {content_type.upper()} ({len(type_items)} items) ==========\n\n"
-            for item in type_items:
-                content += item.to_llms_format()
+            parts.append(f"\n# ========== {content_type.upper()} ({len(type_items)} items) ==========\n\n")
+            parts.extend(self._render_item(item, fragments) for item in type_items)
         
-        return content
+        return "".join(parts)
     
-    def _generate_footer(self, items: List[ContentItem]) -> str:
+    def _generate_footer(self, items: List[ContentItem], now: Optional[datetime.datetime] = None) -> str:
         """Generate footer section"""
         footer = f"""
 # ==========================================
@@ -1157,7 +1730,7 @@ class LLMsTxtGenerator:
 # License: {__license__}
 #
 # Total content items: {len(items)}
-# Generated on: {datetime.datetime.now().isoformat()}
+# Generated on: {(now or datetime.datetime.now()).isoformat()}
 # 
 # This file follows the LLMs.txt specification
 # Learn more: https://llmstxt.org/
@@ -1171,11 +1744,8 @@ class LLMsTxtGenerator:
         if not self.validate_config():
             return []
             
-        extractor_name = self.config['extractor']
-        extractor = self.extractors[extractor_name]
-        
         try:
-            return extractor.extract_content(self.config)
+            return self._extract_items(self._get_extractor_names())
         except Exception as e:
             self.logger.error(f"Error extracting content: {e}")
             return []
@@ -1260,6 +1830,18 @@ def start_webhook_server(port: int = 8080, config_path: str = 'llms_config.yaml'
     expected_secret = webhook_config.get('secret')
     allowed_ips = webhook_config.get('allowed_ips', ['127.0.0.1'])
     
+    # One generator serves every request; it is only rebuilt when the config file changes on disk
+    generator_state = {'generator': LLMsTxtGenerator(config_path), 'mtime': os.stat(config_path).st_mtime}
+    generator_lock = threading.Lock()
+    
+    def get_generator() -> LLMsTxtGenerator:
+        mtime = os.stat(config_path).st_mtime
+        if mtime != generator_state['mtime']:
+            logger.info(f"Config changed, reloading: {config_path}")
+            generator_state['generator'] = LLMsTxtGenerator(config_path)
+            generator_state['mtime'] = mtime
+        return generator_state['generator']
+    
     @app.route('/update', methods=['POST'])
     def webhook_update():
         try:
@@ -1281,9 +1863,9 @@ def start_webhook_server(port: int = 8080, config_path: str = 'llms_config.yaml'
                     logger.warning("Webhook request with invalid secret")
                     return jsonify({'error': 'Invalid secret'}), 403
             
-            # Generate llms.txt
-            generator = LLMsTxtGenerator(config_path)
-            success = generator.generate_llms_txt(force_update=True)
+            # Generate llms.txt; requests are serialised so concurrent hooks don't race on the output files
+            with generator_lock:
+                success = get_generator().generate_llms_txt(force_update=True)
             
             response_data = {
                 'status': 'success' if success else 'no_update',
@@ -1351,29 +1933,48 @@ def watch_directory(content_dir: str, config_path: str = 'llms_config.yaml', deb
         return False
     
     class ContentHandler(FileSystemEventHandler):
+        CONTENT_EXTENSIONS = frozenset({'.md', '.html', '.txt', '.markdown', '.mdx'})
+        
         def __init__(self):
-            self.last_update = 0
+            self.generator = LLMsTxtGenerator(config_path)
+            self._timer = None
+            self._last_change = None
+            self._lock = threading.Lock()
+            self._run_lock = threading.Lock()
             
         def on_modified(self, event):
             if event.is_directory:
                 return
-                
-            # Debounce rapid file changes
-            now = time.time()
-            if now - self.last_update < debounce:
+            
+            # Check if it's a content file; done before debouncing so that
+            # unrelated writes (editor swap files etc.) don't start the debounce window
+            if os.path.splitext(event.src_path)[1].lower() not in self.CONTENT_EXTENSIONS:
                 return
             
-            self.last_update = now
+            logger.debug(f"Content changed: {event.src_path}")
             
-            # Check if it's a content file
-            content_extensions = ['.md', '.html', '.txt', '.markdown', '.mdx']
-            if any(event.src_path.endswith(ext) for ext in content_extensions):
-                logger.info(f"Content changed: {event.src_path}")
-                
-                # Generate llms.txt
+            # Debounce rapid file changes: every event restarts the timer, so a burst
+            # of saves triggers a single regeneration once it has settled
+            with self._lock:
+                self._last_change = event.src_path
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(debounce, self._run)
+                self._timer.daemon = True
+                self._timer.start()
+        
+        def cancel(self):
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+        
+        def _run(self):
+            # Generate llms.txt; a burst arriving mid-run waits for this one to finish
+            with self._run_lock:
+                logger.info(f"Content changed: {self._last_change}")
                 try:
-                    generator = LLMsTxtGenerator(config_path)
-                    generator.generate_llms_txt()
+                    self.generator.generate_llms_txt()
                 except Exception as e:
                     logger.error(f"Error generating llms.txt after file change: {e}")
     
@@ -1392,6 +1993,7 @@ def watch_directory(content_dir: str, config_path: str = 'llms_config.yaml', deb
     # Setup graceful shutdown
     def signal_handler(sig, frame):
         logger.info('Stopping directory watcher...')
+        event_handler.cancel()
         observer.stop()
         observer.join()
         sys.exit(0)
@@ -1404,6 +2006,7 @@ def watch_directory(content_dir: str, config_path: str = 'llms_config.yaml', deb
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
+        event_handler.cancel()
         observer.stop()
         logger.info("Stopped watching directory")
     
@@ -1424,14 +2027,22 @@ def validate_llms_txt(file_path: str) -> bool:
         if not any(line.startswith('# LLMs.txt for') for line in lines[:10]):
             issues.append("Missing proper header")
         
+        # Count item headings and required fields in a single scan
+        content_items = url_count = type_count = 0
+        for match in _VALIDATE_MARKER_RE.finditer(content):
+            marker = match.group()
+            if marker == 'URL: ':
+                url_count += 1
+            elif marker == 'Type: ':
+                type_count += 1
+            elif match.group(1) is None:
+                content_items += 1
+        
         # Check for content items
-        content_items = content.count('# ') - content.count('# =') - content.count('# LLMs.txt')
         if content_items == 0:
             issues.append("No content items found")
         
         # Check for required fields in items
-        url_count = content.count('URL: ')
-        type_count = content.count('Type: ')
         
         if url_count != content_items:
             issues.append(f"Mismatch: {content_items} items but {url_count} URLs")
@@ -2,91 +2,181 @@
 """
 Setup script for Universal LLMs.txt Generator
 """
-from setuptools import setup, find_packages
+import functools
 import os
+import re
 import sys
+import warnings
+from collections.abc import Mapping
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
+
+# A bare `setup.py build`/`build_ext` only copies files, so skip setuptools' heavy
+# import and use distutils when it is still available (removed in Python 3.12)
+_BUILD_COMMANDS = {"build", "build_py", "build_ext"}
+_commands = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+USE_DISTUTILS = bool(_commands) and set(_commands) <= _BUILD_COMMANDS
+if USE_DISTUTILS:
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            from distutils.core import setup
+        # setuptools' distutils shim imports setuptools anyway, so there is nothing left to save
+        USE_DISTUTILS = "setuptools" not in sys.modules
+    except ImportError:
+        USE_DISTUTILS = False
+
+if USE_DISTUTILS:
+    # setuptools-only metadata (install_requires, entry_points, ...) is irrelevant to a build
+    warnings.filterwarnings("ignore", "Unknown distribution option", UserWarning)
 
 # Ensure we're using Python 3.8+
 if sys.version_info < (3, 8):
     sys.exit('Python 3.8 or higher is required')
 
-# Read README for long description
-this_directory = os.path.abspath(os.path.dirname(__file__))
-with open(os.path.join(this_directory, 'README.md'), encoding='utf-8') as f:
-    long_description = f.read()
+# Project root, resolved once and reused for every input file
+BASE = Path(__file__).resolve().parent
+
+# One requirement per non-blank, non-comment line, with surrounding whitespace trimmed
+# Matched on the raw bytes so blank and comment lines are never decoded at all
+_REQ_RE = re.compile(rb'^[ \t]*([^#\s].*?)[ \t\r]*$', re.M)
 
-# Read requirements
+# Read requirements (cached, and returned as a tuple so the cached value can't be mutated)
+@functools.lru_cache(maxsize=8)
 def read_requirements(filename):
-    with open(os.path.join(this_directory, filename), encoding='utf-8') as f:
-        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
-
-requirements = read_requirements('requirements.txt')
-
-setup(
-    name="universal-llms-txt-generator",
-    version="1.0.0",
-    author="AsifMinar",
-    author_email="asifminar.dev@gmail.com",
-    description="Universal tool to generate and maintain llms.txt files for any website stack",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/AsifMinar/Universal-LLMS.txt-Generator",
-    project_urls={
-        "Bug Reports": "https://github.com/AsifMinar/Universal-LLMS.txt-Generator/issues",
-        "Source": "https://github.com/AsifMinar/Universal-LLMS.txt-Generator",
-        "Documentation": "https://github.com/AsifMinar/Universal-LLMS.txt-Generator/wiki",
-        "Funding": "https://github.com/sponsors/AsifMinar",
-    },
-    packages=find_packages(where="src") if os.path.exists("src") else ["."],
-    package_dir={"": "src"} if os.path.exists("src") else {},
-    py_modules=["llms_txt_generator"] if not os.path.exists("src") else [],
-    classifiers=[
-        "Development Status :: 5 - Production/Stable",
-        "Intended Audience :: Developers",
-        "Intended Audience :: System Administrators",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Topic :: Internet :: WWW/HTTP :: Site Management",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Text Processing :: Markup :: XML",
-        "Topic :: Utilities",
-    ],
-    keywords="llms llmstxt ai ml sitemap robots.txt wordpress django flask static-site",
-    python_requires=">=3.8",
-    install_requires=requirements,
-    extras_require={
-        "dev": read_requirements('requirements-dev.txt'),
-        "test": [
-            "pytest>=7.4.0",
-            "pytest-cov>=4.1.0",
-            "responses>=0.23.0",
-        ],
-        "docs": [
-            "sphinx>=7.0.0",
-            "sphinx-rtd-theme>=1.3.0",
-            "mkdocs>=1.5.0",
-            "mkdocs-material>=9.0.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "llms-txt-gen=llms_txt_generator:main",
-            "llms-txt-generator=llms_txt_generator:main",
-            "universal-llms-txt=llms_txt_generator:main",
-        ],
-    },
-    include_package_data=True,
-    package_data={
-        "": ["*.yaml", "*.yml", "*.json", "*.md", "*.txt"],
-    },
-    zip_safe=False,
-    platforms=["any"],
-    license="MIT",
-    test_suite="tests",
-)
\ No newline at end of file
+    data = (BASE / filename).read_bytes()
+    return tuple(req.decode('utf-8') for req in _REQ_RE.findall(data))
+
+
+class LazyExtras(Mapping):
+    """extras_require mapping whose file-backed extras are only read when looked up"""
+
+    def __init__(self, files, extras):
+        self._files = files
+        self._extras = extras
+
+    def __getitem__(self, key):
+        if key in self._files:
+            return read_requirements(self._files[key])
+        return self._extras[key]
+
+    def __iter__(self):
+        return chain(self._files, self._extras)
+
+    def __len__(self):
+        return len(self._files) + len(self._extras)
+
+
+_PROJECT_URLS = MappingProxyType({
+    "Bug Reports": "https://github.com/AsifMinar/Universal-LLMS.txt-Generator/issues",
+    "Source": "https://github.com/AsifMinar/Universal-LLMS.txt-Generator",
+    "Documentation": "https://github.com/AsifMinar/Universal-LLMS.txt-Generator/wiki",
+    "Funding": "https://github.com/sponsors/AsifMinar",
+})
+
+_CLASSIFIERS = (
+    "Development Status :: 5 - Production/Stable",
+    "Intended Audience :: Developers",
+    "Intended Audience :: System Administrators",
+    "License :: OSI Approved :: MIT License",
+    "Operating System :: OS Independent",
+    "Programming Language :: Python :: 3",
+    "Programming Language :: Python :: 3.8",
+    "Programming Language :: Python :: 3.9",
+    "Programming Language :: Python :: 3.10",
+    "Programming Language :: Python :: 3.11",
+    "Programming Language :: Python :: 3.12",
+    "Topic :: Internet :: WWW/HTTP :: Site Management",
+    "Topic :: Software Development :: Libraries :: Python Modules",
+    "Topic :: Text Processing :: Markup :: XML",
+    "Topic :: Utilities",
+)
+
+_KEYWORDS = "llms llmstxt ai ml sitemap robots.txt wordpress django flask static-site"
+
+# Extras listed inline; "dev" is read from requirements-dev.txt on demand
+_EXTRAS = {
+    "test": (
+        "pytest>=7.4.0",
+        "pytest-cov>=4.1.0",
+        "responses>=0.23.0",
+    ),
+    "performance": (
+        "aiofiles>=23.1.0",
+        "selectolax>=0.3.17",
+        "requests-cache>=1.0.0",
+        "orjson>=3.9.0",
+        "msgpack>=1.0.0",
+        "brotli>=1.0.9",
+    ),
+    "docs": (
+        "sphinx>=7.0.0",
+        "sphinx-rtd-theme>=1.3.0",
+        "mkdocs>=1.5.0",
+        "mkdocs-material>=9.0.0",
+    ),
+}
+
+# One CLI target under three command names. The aliases stay for users and scripts that
+# already call them; wheel-installed wrappers import the target directly, with no
+# pkg_resources lookup, so each extra name costs one tiny file at install time
+_CLI_TARGET = "llms_txt_generator:main"
+_CLI_NAMES = ("llms-txt-gen", "llms-txt-generator", "universal-llms-txt")
+
+_ENTRY_POINTS = {
+    "console_scripts": tuple(f"{name}={_CLI_TARGET}" for name in _CLI_NAMES),
+}
+
+_PACKAGE_DATA = {
+    "": ["*.yaml", "*.yml", "*.json", "*.md", "*.txt"],
+}
+
+
+def main():
+    """Read the package inputs and run setup(); kept out of module scope so importing setup.py is free"""
+    # Read README for long description
+    long_description = (BASE / 'README.md').read_text(encoding='utf-8')
+    requirements = read_requirements('requirements.txt')
+
+    # Probe the layout once instead of once per setup() argument; the package list
+    # is known up front, so there is no need to walk the tree with find_packages
+    has_src = os.path.isdir("src")
+
+    # setuptools is only imported once setup() is really going to run, so importing
+    # setup.py for its helpers does not pay for it (distutils is already loaded above)
+    if USE_DISTUTILS:
+        from distutils.core import setup
+    else:
+        from setuptools import setup
+
+    setup(
+        name="universal-llms-txt-generator",
+        version="1.0.0",
+        author="AsifMinar",
+        author_email="asifminar.dev@gmail.com",
+        description="Universal tool to generate and maintain llms.txt files for any website stack",
+        long_description=long_description,
+        long_description_content_type="text/markdown",
+        url="https://github.com/AsifMinar/Universal-LLMS.txt-Generator",
+        project_urls=dict(_PROJECT_URLS),
+        packages=["llms_txt_generator"] if has_src else ["."],
+        package_dir={"": "src"} if has_src else {},
+        py_modules=[] if has_src else ["llms_txt_generator"],
+        classifiers=list(_CLASSIFIERS),
+        keywords=_KEYWORDS,
+        python_requires=">=3.8",
+        install_requires=requirements,
+        extras_require=LazyExtras({"dev": 'requirements-dev.txt'}, _EXTRAS),
+        entry_points=_ENTRY_POINTS,
+        include_package_data=True,
+        package_data=_PACKAGE_DATA,
+        zip_safe=False,
+        platforms=["any"],
+        license="MIT",
+        test_suite="tests",
+    )
+
+
+if __name__ == "__main__":
+    main()
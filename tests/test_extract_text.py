@@ -0,0 +1,32 @@
+"""Both HTML backends of ContentExtractor._extract_text must produce the same text"""
+import pytest
+
+import llms_txt_generator as generator
+
+INLINE_MARKUP = [
+    ('<p><strong>Note</strong>: read the <a href="/docs">docs</a>, then for<em>ever</em> hold.</p>',
+     'Note: read the docs, then forever hold.'),
+    ('<p>a</p>\n<p>b</p>', 'a b'),
+    ('line<br>two', 'linetwo'),
+    ('<p>kept</p><script>dropped()</script><style>p {}</style>', 'kept'),
+]
+
+
+@pytest.fixture(params=['selectolax', 'beautifulsoup'])
+def extractor(request, monkeypatch):
+    if request.param == 'selectolax':
+        if generator.HTMLParser is None:
+            pytest.skip('selectolax is not installed')
+    else:
+        monkeypatch.setattr(generator, 'HTMLParser', None)
+    return generator.StaticSiteExtractor()
+
+
+@pytest.mark.parametrize('html_content,expected', INLINE_MARKUP)
+def test_extract_text_inline_markup(extractor, html_content, expected):
+    assert extractor._extract_text(html_content) == (expected, len(expected.split()))
+
+
+@pytest.mark.parametrize('html_content,expected', INLINE_MARKUP)
+def test_strip_tags_matches_extract_text(extractor, html_content, expected):
+    assert extractor._strip_tags(html_content) == expected